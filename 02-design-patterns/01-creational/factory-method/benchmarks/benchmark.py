@@ -416,11 +416,25 @@ def benchmark_memory_usage():
     print("🚀 基准测试6: 内存使用")
     print("=" * 70)
 
-    import sys
     import gc
+    import tracemalloc
 
-    # 强制垃圾回收
-    gc.collect()
+    def traced_size(build: Callable[[], list]) -> int:
+        """用tracemalloc统计build()实际新分配的字节数
+
+        sys.getsizeof只算对象头，漏掉__dict__和属性值，
+        且同一个缓存实例会被重复累加。
+        """
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            objects = build()
+            size = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        del objects
+        return size
 
     results = []
 
@@ -428,40 +442,26 @@ def benchmark_memory_usage():
     n = 1000
 
     # 1. 直接创建
-    gc.collect()
-    products_direct = []
-    for _ in range(n):
-        products_direct.append(ConcreteProductA())
-    size_direct = sum(sys.getsizeof(p) for p in products_direct)
+    size_direct = traced_size(lambda: [ConcreteProductA() for _ in range(n)])
     results.append(("直接创建", size_direct))
 
     # 2. 工厂创建
-    gc.collect()
     factory = GenericFactory(ConcreteProductA)
-    products_factory = []
-    for _ in range(n):
-        products_factory.append(factory.create())
-    size_factory = sum(sys.getsizeof(p) for p in products_factory)
+    size_factory = traced_size(lambda: [factory.create() for _ in range(n)])
     results.append(("泛型工厂创建", size_factory))
 
     # 3. 缓存工厂（多实例）
-    gc.collect()
     cached_factory = CachedGenericFactory(ConcreteProductA, cache_enabled=True)
-    products_cached = []
-    for i in range(n):
-        products_cached.append(cached_factory.create(cache_key=f"key_{i}"))
-    size_cached = sum(sys.getsizeof(p) for p in products_cached)
+    size_cached = traced_size(
+        lambda: [cached_factory.create(cache_key=f"key_{i}") for i in range(n)]
+    )
     results.append(("缓存工厂(多实例)", size_cached))
 
     # 4. 缓存工厂（单实例）
-    gc.collect()
     cached_factory_single = CachedGenericFactory(ConcreteProductA, cache_enabled=True)
-    products_cached_single = []
-    for _ in range(n):
-        products_cached_single.append(
-            cached_factory_single.create(cache_key="single")
-        )
-    size_cached_single = sum(sys.getsizeof(p) for p in products_cached_single)
+    size_cached_single = traced_size(
+        lambda: [cached_factory_single.create(cache_key="single") for _ in range(n)]
+    )
     results.append(("缓存工厂(单实例)", size_cached_single))
 
     # 打印结果
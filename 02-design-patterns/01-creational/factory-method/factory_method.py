@@ -166,6 +166,20 @@ class FunctionalProduct:
         return {"name": self.name, "type": "functional"}
 
 
+# 产品类型 -> 工厂函数，模块级构建一次，避免每次调用重建字典和闭包
+_FUNCTIONAL_FACTORIES: dict[str, Callable[[], FunctionalProduct]] = {
+    "type_a": lambda: FunctionalProduct(
+        name="Functional Product A", operation_func=lambda: "函数式产品A的操作"
+    ),
+    "type_b": lambda: FunctionalProduct(
+        name="Functional Product B", operation_func=lambda: "函数式产品B的操作"
+    ),
+    "type_c": lambda: FunctionalProduct(
+        name="Functional Product C", operation_func=lambda: "函数式产品C的操作"
+    ),
+}
+
+
 def create_product_factory(product_type: str) -> Callable[[], FunctionalProduct]:
     """
     函数式工厂：返回一个创建产品的函数
@@ -176,23 +190,11 @@ def create_product_factory(product_type: str) -> Callable[[], FunctionalProduct]
     Returns:
         创建产品的工厂函数
     """
-    factories = {
-        "type_a": lambda: FunctionalProduct(
-            name="Functional Product A", operation_func=lambda: "函数式产品A的操作"
-        ),
-        "type_b": lambda: FunctionalProduct(
-            name="Functional Product B", operation_func=lambda: "函数式产品B的操作"
-        ),
-        "type_c": lambda: FunctionalProduct(
-            name="Functional Product C", operation_func=lambda: "函数式产品C的操作"
-        ),
-    }
-
-    factory = factories.get(product_type)
+    factory = _FUNCTIONAL_FACTORIES.get(product_type)
     if not factory:
         raise ValueError(
             f"未知的产品类型: {product_type}. "
-            f"可用类型: {list(factories.keys())}"
+            f"可用类型: {list(_FUNCTIONAL_FACTORIES.keys())}"
         )
 
     return factory
@@ -167,17 +167,19 @@ def singleton(cls: type[T]) -> type[T]:
         - 保留原类的所有属性
         - 支持类型检查
     """
-    instances: dict[type, Any] = {}
+    # 实例保存在闭包单元中，每次调用只需读取一个自由变量
+    instance: T | None = None
     lock = threading.Lock()
     
     @wraps(cls)
     def get_instance(*args: Any, **kwargs: Any) -> T:
         """获取单例实例"""
-        if cls not in instances:
+        nonlocal instance
+        if instance is None:
             with lock:
-                if cls not in instances:
-                    instances[cls] = cls(*args, **kwargs)
-        return cast(T, instances[cls])
+                if instance is None:
+                    instance = cls(*args, **kwargs)
+        return instance
     
     # 保留原类的属性
     get_instance.__name__ = cls.__name__  # type: ignore[attr-defined]
@@ -186,9 +188,9 @@ def singleton(cls: type[T]) -> type[T]:
     # 添加重置方法 (用于测试)
     def reset_instance() -> None:
         """重置单例实例 (仅用于测试)"""
+        nonlocal instance
         with lock:
-            if cls in instances:
-                del instances[cls]
+            instance = None
     
     get_instance._reset_instance = reset_instance  # type: ignore[attr-defined]
     
@@ -11,6 +11,7 @@ Decorator Pattern - 装饰器模式完整实现
 """
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from functools import wraps, lru_cache
 from typing import Callable, Any, TypeVar, ParamSpec, Type
 import time
@@ -24,6 +25,9 @@ P = ParamSpec('P')
 R = TypeVar('R')
 T = TypeVar('T')
 
+# 缓存未命中标记（区分“未缓存”与“缓存值为None”）
+_MISSING = object()
+
 # ============================================================================
 # 1. 经典OOP装饰器 - 遵循GoF设计模式
 # ============================================================================
@@ -218,10 +222,10 @@ def rate_limit(calls: int, period: float):
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             with lock:
-                current = time.time()
+                current = time.monotonic()
                 
-                # 移除过期的时间戳
-                timestamps[:] = [t for t in timestamps if current - t < period]
+                # 时间戳单调递增：二分定位过期前缀并整体删除
+                del timestamps[:bisect_right(timestamps, current - period)]
                 
                 if len(timestamps) >= calls:
                     wait_time = period - (current - timestamps[0])
@@ -331,12 +335,14 @@ class Cache:
         self.lock = threading.Lock()
     
     def __call__(self, *args, **kwargs):
-        key = (args, tuple(sorted(kwargs.items())))
+        # 无关键字参数时直接用空元组，省去临时列表与排序
+        key = (args, tuple(sorted(kwargs.items())) if kwargs else ())
         
         with self.lock:
-            if key in self.cache:
+            cached = self.cache.get(key, _MISSING)
+            if cached is not _MISSING:
                 self.hits += 1
-                return self.cache[key]
+                return cached
             
             self.misses += 1
         
@@ -410,16 +416,17 @@ class Timer:
 
 def singleton(cls: Type[T]) -> Type[T]:
     """单例装饰器"""
-    instances: dict[Type, Any] = {}
+    instance = None
     lock = threading.Lock()
     
     @wraps(cls)
     def get_instance(*args, **kwargs):
-        if cls not in instances:
+        nonlocal instance
+        if instance is None:
             with lock:
-                if cls not in instances:
-                    instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+                if instance is None:
+                    instance = cls(*args, **kwargs)
+        return instance
     
     return get_instance  # type: ignore
 
@@ -450,13 +457,14 @@ def frozen(cls: Type[T]) -> Type[T]:
     original_setattr = cls.__setattr__
     original_delattr = cls.__delattr__
     
+    # 直接查实例字典，避免hasattr在未冻结时抛出并吞掉AttributeError
     def __setattr__(self, key, value):
-        if hasattr(self, '_frozen'):
+        if '_frozen' in self.__dict__:
             raise AttributeError(f"Cannot modify frozen class {cls.__name__}")
         original_setattr(self, key, value)
     
     def __delattr__(self, key):
-        if hasattr(self, '_frozen'):
+        if '_frozen' in self.__dict__:
             raise AttributeError(f"Cannot modify frozen class {cls.__name__}")
         original_delattr(self, key)
     
@@ -495,9 +503,12 @@ def cache_property(func: Callable) -> property:
     
     @wraps(func)
     def wrapper(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, func(self))
-        return getattr(self, attr_name)
+        # 命中时只需一次实例字典查找
+        value = self.__dict__.get(attr_name, _MISSING)
+        if value is _MISSING:
+            value = func(self)
+            setattr(self, attr_name, value)
+        return value
     
     return property(wrapper)
 
@@ -538,26 +549,27 @@ def memoize(config: MemoizeConfig | None = None):
         
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            key = (args, tuple(sorted(kwargs.items())))
+            key = (args, tuple(sorted(kwargs.items())) if kwargs else ())
             current_time = time.time()
             
             with lock:
                 # 检查缓存
-                if key in cache:
-                    result, cached_time = cache[key]
+                entry = cache.get(key)
+                if entry is not None:
+                    result, cached_time = entry
                     if config.timeout is None or (current_time - cached_time) < config.timeout:
                         return result
                 
                 # 检查大小限制
                 if config.maxsize and len(cache) >= config.maxsize:
-                    # 删除最旧的项
-                    oldest_key = min(cache.keys(), key=lambda k: cache[k][1])
-                    del cache[oldest_key]
+                    # 写入时总是移到末尾，字典顺序即写入时间顺序，首项就是最旧的项
+                    del cache[next(iter(cache))]
             
             # 计算结果
             result = func(*args, **kwargs)
             
             with lock:
+                cache.pop(key, None)
                 cache[key] = (result, current_time)
             
             return result
@@ -17,6 +17,22 @@ import time
 
 T = TypeVar('T')
 
+
+def _partition(data: list[int], pivot: int) -> tuple[list[int], list[int], list[int]]:
+    """一次遍历完成三路划分（小于/等于/大于pivot）"""
+    left: list[int] = []
+    middle: list[int] = []
+    right: list[int] = []
+    for x in data:
+        if x < pivot:
+            left.append(x)
+        elif x > pivot:
+            right.append(x)
+        else:
+            middle.append(x)
+    return left, middle, right
+
+
 # ============================================================================
 # 1. 经典OOP实现 - 遵循GoF设计模式
 # ============================================================================
@@ -58,10 +74,7 @@ class QuickSortStrategy(Strategy):
     def execute(self, data: list[int]) -> list[int]:
         if len(data) <= 1:
             return data
-        pivot = data[len(data)//2]
-        left = [x for x in data if x < pivot]
-        middle = [x for x in data if x == pivot]
-        right = [x for x in data if x > pivot]
+        left, middle, right = _partition(data, data[len(data)//2])
         return self.execute(left) + middle + self.execute(right)
     
     def get_name(self) -> str:
@@ -141,10 +154,7 @@ def quick_sort(data: list[int]) -> list[int]:
     """快速排序"""
     if len(data) <= 1:
         return data
-    pivot = data[len(data)//2]
-    left = [x for x in data if x < pivot]
-    middle = [x for x in data if x == pivot]
-    right = [x for x in data if x > pivot]
+    left, middle, right = _partition(data, data[len(data)//2])
     return quick_sort(left) + middle + quick_sort(right)
 
 
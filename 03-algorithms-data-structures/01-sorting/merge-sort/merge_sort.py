@@ -357,6 +357,8 @@ def _merge_and_count(left: list[int], right: list[int]) -> tuple[list[int], int]
 
 class ListNode:
     """链表节点"""
+    __slots__ = ('val', 'next')
+    
     def __init__(self, val: int = 0, next: 'ListNode | None' = None):
         self.val = val
         self.next = next
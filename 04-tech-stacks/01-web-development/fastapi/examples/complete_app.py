@@ -12,6 +12,7 @@ FastAPI - 完整的实战应用示例
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
@@ -644,17 +645,25 @@ class ChatRoom:
     
     def disconnect(self, room_id: str, websocket: WebSocket):
         """断开连接"""
-        if room_id in self.active_connections:
-            self.active_connections[room_id].remove(websocket)
+        connections = self.active_connections.get(room_id)
+        # 广播失败时可能已被移除，连接自身的处理器随后还会再调用一次
+        if connections is not None and websocket in connections:
+            connections.remove(websocket)
             
             if not self.active_connections[room_id]:
                 del self.active_connections[room_id]
     
     async def broadcast(self, room_id: str, message: str):
         """广播消息到聊天室"""
-        if room_id in self.active_connections:
-            for connection in self.active_connections[room_id]:
-                await connection.send_text(message)
+        connections = list(self.active_connections.get(room_id, ()))
+        # 并发发送；收集异常而不是抛给调用方，失效连接直接移出聊天室
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(room_id, connection)
 
 
 chat_manager = ChatRoom()
@@ -725,6 +734,7 @@ from pathlib import Path
 
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_CHUNK_SIZE = 64 * 1024  # 分块写入的块大小
 
 
 class SharedFile(Base):
@@ -775,16 +785,18 @@ async def upload_file(
     unique_filename = f"{timestamp}_{file.filename}"
     file_path = UPLOAD_DIR / unique_filename
     
-    # 保存文件
+    # 分块保存文件，内存占用与上传文件大小无关
+    file_size = 0
     async with aiofiles.open(file_path, 'wb') as out_file:
-        content = await file.read()
-        await out_file.write(content)
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await out_file.write(chunk)
+            file_size += len(chunk)
     
     # 创建数据库记录
     db_file = SharedFile(
         filename=file.filename,
         filepath=str(file_path),
-        file_size=len(content),
+        file_size=file_size,
         content_type=file.content_type or "application/octet-stream",
         owner_id=current_user.id,
         is_public=is_public
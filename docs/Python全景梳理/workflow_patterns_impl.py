@@ -22,7 +22,7 @@ from collections import deque
 import threading
 import time
 from abc import ABC, abstractmethod
-import uuid
+import itertools
 from itertools import permutations
 import queue
 import concurrent.futures
@@ -42,26 +42,28 @@ class TaskStatus(Enum):
 
 class Token:
     """Petri网令牌"""
+    _ids = itertools.count(1)  # 进程内递增整数ID，比uuid4更轻量
+    
     def __init__(self, data: Any = None):
-        self.id = uuid.uuid4()
+        self.id = next(Token._ids)
         self.data = data
         self.created_at = time.time()
     
     def __repr__(self):
-        return f"Token({self.id.hex[:8]})"
+        return f"Token({self.id})"
 
 class Place:
     """Petri网库所"""
     def __init__(self, name: str):
         self.name = name
-        self.tokens: List[Token] = []
+        self.tokens: deque[Token] = deque()
     
     def add_token(self, token: Token):
         self.tokens.append(token)
     
     def remove_token(self) -> Optional[Token]:
         if self.tokens:
-            return self.tokens.pop(0)
+            return self.tokens.popleft()
         return None
     
     def has_token(self) -> bool:
@@ -121,6 +123,8 @@ class PetriNet:
         self.name = name
         self.places: Dict[str, Place] = {}
         self.transitions: Dict[str, Transition] = {}
+        self._schedule: List[Transition] = []  # 轮转调度顺序
+        self._cursor = 0
     
     def add_place(self, name: str) -> Place:
         place = Place(name)
@@ -129,6 +133,11 @@ class PetriNet:
     
     def add_transition(self, name: str, action: Optional[Callable] = None) -> Transition:
         trans = Transition(name, action)
+        if name in self.transitions:
+            idx = self._schedule.index(self.transitions[name])
+            self._schedule[idx] = trans
+        else:
+            self._schedule.append(trans)
         self.transitions[name] = trans
         return trans
     
@@ -143,11 +152,15 @@ class PetriNet:
         return [t for t in self.transitions.values() if t.is_enabled()]
     
     def step(self) -> bool:
-        """执行一步"""
-        enabled = self.get_enabled_transitions()
-        if enabled:
-            enabled[0].fire()
-            return True
+        """执行一步：从游标处轮转查找第一个可用变迁并触发"""
+        n = len(self._schedule)
+        for offset in range(n):
+            idx = (self._cursor + offset) % n
+            trans = self._schedule[idx]
+            if trans.is_enabled():
+                trans.fire()
+                self._cursor = (idx + 1) % n
+                return True
         return False
     
     def run(self, max_steps: int = 100) -> int:
@@ -159,7 +172,7 @@ class PetriNet:
             steps += 1
         return steps
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """工作流任务"""
     id: str
@@ -384,14 +397,15 @@ class SynchronizationPattern:
         """同步并执行后续任务"""
         self.waiting = True
         
-        if self.can_proceed():
+        # 一次扫描同时得到“能否继续”和“未完成列表”
+        incomplete = self.get_incomplete_inputs()
+        if not incomplete:
             print(f"✓ 所有 {len(self.inputs)} 个分支已完成，执行后续任务")
             self.waiting = False
             if self.successor:
                 self.successor.execute()
                 return self.successor
         else:
-            incomplete = self.get_incomplete_inputs()
             print(f"⏳ 等待分支完成: {incomplete}")
         
         return None
@@ -406,8 +420,12 @@ class SynchronizationPattern:
     
     def check_deadlock(self) -> Tuple[bool, List[str]]:
         """检查是否存在死锁"""
-        failed = [t.name for t in self.inputs if t.status == TaskStatus.FAILED]
-        cancelled = [t.name for t in self.inputs if t.status == TaskStatus.CANCELLED]
+        failed, cancelled = [], []
+        for t in self.inputs:
+            if t.status == TaskStatus.FAILED:
+                failed.append(t.name)
+            elif t.status == TaskStatus.CANCELLED:
+                cancelled.append(t.name)
         
         if failed or cancelled:
             return True, failed + cancelled
@@ -515,10 +533,13 @@ class SimpleMergePattern:
     
     def check_and_trigger(self) -> Optional[Task]:
         """检查是否有输入完成并触发"""
-        completed = [t for t in self.inputs if t.status == TaskStatus.COMPLETED]
+        if self.triggered:
+            return None
+        
+        # 只需第一个已完成的输入，找到即停止扫描
+        task = next((t for t in self.inputs if t.status == TaskStatus.COMPLETED), None)
         
-        if completed and not self.triggered:
-            task = completed[0]
+        if task is not None:
             print(f"✓ 检测到任务完成: {task.name}，触发后续")
             self.triggered = True
             self.trigger_count += 1
@@ -616,6 +637,7 @@ class StructuredSynchronizingMerge:
     def __init__(self, name: str = "StructuredSyncMerge"):
         self.name = name
         self.all_branches: List[str] = []
+        self._branch_set: Set[str] = set()  # all_branches的成员索引
         self.activated_branches: Set[str] = set()
         self.completed_branches: Set[str] = set()
         self.tasks: Dict[str, Task] = {}
@@ -624,11 +646,12 @@ class StructuredSynchronizingMerge:
     def register_branches(self, branch_names: List[str]):
         """注册所有可能的分支"""
         self.all_branches = branch_names
+        self._branch_set = set(branch_names)
     
     def activate_branches(self, branch_names: List[str]):
         """激活特定分支"""
         for name in branch_names:
-            if name in self.all_branches:
+            if name in self._branch_set:
                 self.activated_branches.add(name)
         print(f"✓ 激活的分支: {self.activated_branches}")
     
@@ -690,6 +713,7 @@ class MultiMergePattern:
         self.inputs: List[Task] = []
         self.successor: Optional[Task] = None
         self.trigger_history: List[str] = []
+        self._triggered: Set[str] = set()  # 与trigger_history同步，O(1)去重
         self.trigger_count = 0
     
     def add_input(self, task: Task):
@@ -704,8 +728,9 @@ class MultiMergePattern:
         """检查并触发所有已完成的输入"""
         triggers = 0
         for task in self.inputs:
-            if task.status == TaskStatus.COMPLETED and task.name not in self.trigger_history:
+            if task.status == TaskStatus.COMPLETED and task.name not in self._triggered:
                 print(f"✓ 检测到 {task.name} 完成，触发后续任务（第{self.trigger_count + 1}次）")
+                self._triggered.add(task.name)
                 self.trigger_history.append(task.name)
                 self.trigger_count += 1
                 
@@ -944,36 +969,48 @@ class ImplicitTerminationPattern:
         """获取运行中的任务"""
         return [t for t in self.tasks.values() if t.status == TaskStatus.RUNNING]
     
+    def _classify_tasks(self) -> Tuple[List[Task], int, int]:
+        """单次遍历统计：就绪任务列表、运行中数、已完成数"""
+        ready: List[Task] = []
+        running = completed = 0
+        for t in self.tasks.values():
+            status = t.status
+            if status == TaskStatus.READY:
+                ready.append(t)
+            elif status == TaskStatus.RUNNING:
+                running += 1
+            elif status == TaskStatus.COMPLETED:
+                completed += 1
+        return ready, running, completed
+    
     def can_terminate(self) -> bool:
         """检查是否可以终止"""
-        ready = self.get_ready_tasks()
-        running = self.get_running_tasks()
-        return len(ready) == 0 and len(running) == 0
+        return not any(t.status in (TaskStatus.READY, TaskStatus.RUNNING)
+                       for t in self.tasks.values())
     
-    def check_termination(self) -> Tuple[bool, str]:
-        """检查终止条件"""
-        ready = self.get_ready_tasks()
-        running = self.get_running_tasks()
-        
-        if len(ready) == 0 and len(running) == 0:
+    def _termination_result(self, ready: List[Task], running: int,
+                            completed: int) -> Tuple[bool, str]:
+        if not ready and running == 0:
             self.terminated = True
-            completed = sum(1 for t in self.tasks.values() 
-                          if t.status == TaskStatus.COMPLETED)
             return True, f"隐式终止：{completed}个任务已完成"
         
-        return False, f"还有{len(ready)}个就绪任务，{len(running)}个运行中任务"
+        return False, f"还有{len(ready)}个就绪任务，{running}个运行中任务"
+    
+    def check_termination(self) -> Tuple[bool, str]:
+        """检查终止条件"""
+        return self._termination_result(*self._classify_tasks())
     
     def run_until_termination(self, max_steps: int = 100) -> Tuple[int, bool]:
-        """运行直到终止或达到最大步数"""
+        """运行直到终止或达到最大步数（每步只遍历一次任务表）"""
         steps = 0
         
         while steps < max_steps:
-            can_term, msg = self.check_termination()
+            ready, running, completed = self._classify_tasks()
+            can_term, msg = self._termination_result(ready, running, completed)
             if can_term:
                 print(f"✓ {msg}")
                 return steps, True
             
-            ready = self.get_ready_tasks()
             if ready:
                 task = ready[0]
                 print(f"  → 执行任务: {task.name}")
@@ -1355,10 +1392,19 @@ class CriticalSectionPattern:
         return len(self.tasks_in_cs) <= 1
     
     def verify(self) -> Tuple[bool, str]:
-        for i, (task1, start1, end1) in enumerate(self.cs_history):
-            for task2, start2, end2 in self.cs_history[i+1:]:
-                if not (end1 <= start2 or end2 <= start1):
-                    return False, f"发现互斥违反: {task1} 和 {task2} 同时执行"
+        # 按进入时间排序后扫描：只需与此前结束最晚的区间比较，O(n log n)
+        latest: Optional[Tuple[str, float, float]] = None
+        latest_before: Optional[Tuple[str, float, float]] = None  # 进入时间严格更早者
+        prev_start: Optional[float] = None
+        for task, start, end in sorted(self.cs_history, key=lambda r: r[1]):
+            if start != prev_start:
+                latest_before, prev_start = latest, start
+            # 零长度区间只与严格包含它的区间重叠
+            other = latest if end > start else latest_before
+            if other is not None and start < other[2]:
+                return False, f"发现互斥违反: {other[0]} 和 {task} 同时执行"
+            if latest is None or end > latest[2]:
+                latest = (task, start, end)
         return True, "互斥性验证通过"
 
 
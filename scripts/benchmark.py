@@ -11,6 +11,7 @@ Usage:
 
 import sys
 import time
+import contextlib
 import json
 import platform
 from typing import Dict, List, Callable, Any
@@ -25,7 +26,7 @@ RESET = "\033[0m"
 BOLD = "\033[1m"
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """基准测试结果"""
     name: str
@@ -66,19 +67,22 @@ class Benchmarker:
         for _ in range(warmup):
             func()
 
-        # 测试
+        # 测试（计时函数和append绑定为局部变量，减少循环内的属性查找开销）
         times: List[float] = []
+        perf_counter = time.perf_counter
+        append = times.append
         for _ in range(iterations):
-            start = time.perf_counter()
+            start = perf_counter()
             func()
-            end = time.perf_counter()
-            times.append(end - start)
+            end = perf_counter()
+            append(end - start)
 
         total_time = sum(times)
         avg_time = total_time / iterations
         min_time = min(times)
         max_time = max(times)
-        std_dev = statistics.stdev(times) if len(times) > 1 else 0
+        # 复用已算出的均值，stdev内部不再重新求一遍mean
+        std_dev = statistics.stdev(times, xbar=avg_time) if len(times) > 1 else 0
         ops_per_sec = iterations / total_time if total_time > 0 else 0
 
         result = BenchmarkResult(
@@ -97,15 +101,17 @@ class Benchmarker:
 
     def print_result(self, result: BenchmarkResult) -> None:
         """打印测试结果"""
-        print(f"{BOLD}{result.name}{RESET}")
-        print(f"  迭代次数: {result.iterations:,}")
-        print(f"  总时间:   {result.total_time:.6f}s")
-        print(f"  平均时间: {result.avg_time*1e6:.2f}μs")
-        print(f"  最小时间: {result.min_time*1e6:.2f}μs")
-        print(f"  最大时间: {result.max_time*1e6:.2f}μs")
-        print(f"  标准差:   {result.std_dev*1e6:.2f}μs")
-        print(f"  吞吐量:   {result.ops_per_sec:,.0f} ops/s")
-        print()
+        # 整块拼好后一次输出，代替逐行 print 的多次写入
+        print(
+            f"{BOLD}{result.name}{RESET}\n"
+            f"  迭代次数: {result.iterations:,}\n"
+            f"  总时间:   {result.total_time:.6f}s\n"
+            f"  平均时间: {result.avg_time*1e6:.2f}μs\n"
+            f"  最小时间: {result.min_time*1e6:.2f}μs\n"
+            f"  最大时间: {result.max_time*1e6:.2f}μs\n"
+            f"  标准差:   {result.std_dev*1e6:.2f}μs\n"
+            f"  吞吐量:   {result.ops_per_sec:,.0f} ops/s\n"
+        )
 
     def run_basic_benchmarks(self) -> None:
         """运行基础基准测试"""
@@ -254,27 +260,32 @@ class Benchmarker:
         self.print_header("基准测试总结")
         
         system_info = self.generate_system_info()
-        print(f"{BOLD}系统信息:{RESET}")
-        print(f"  Python: {system_info['python_version'].split()[0]}")
-        print(f"  实现:   {system_info['python_implementation']}")
-        print(f"  平台:   {system_info['platform']}")
-        print(f"  处理器: {system_info['processor']}")
-        print()
-
-        print(f"{BOLD}测试统计:{RESET}")
-        print(f"  总测试数: {len(self.results)}")
+        # 各段拼好后一次 sys.stdout.write，代替二十来次零散 print
+        parts = [
+            f"{BOLD}系统信息:{RESET}\n",
+            f"  Python: {system_info['python_version'].split()[0]}\n",
+            f"  实现:   {system_info['python_implementation']}\n",
+            f"  平台:   {system_info['platform']}\n",
+            f"  处理器: {system_info['processor']}\n",
+            "\n",
+            f"{BOLD}测试统计:{RESET}\n",
+            f"  总测试数: {len(self.results)}\n",
+        ]
         
         if self.results:
             fastest = max(self.results, key=lambda r: r.ops_per_sec)
             slowest = min(self.results, key=lambda r: r.ops_per_sec)
             
-            print(f"\n{GREEN}最快操作:{RESET}")
-            print(f"  {fastest.name}")
-            print(f"  {fastest.ops_per_sec:,.0f} ops/s")
-            
-            print(f"\n{YELLOW}最慢操作:{RESET}")
-            print(f"  {slowest.name}")
-            print(f"  {slowest.ops_per_sec:,.0f} ops/s")
+            parts += [
+                f"\n{GREEN}最快操作:{RESET}\n",
+                f"  {fastest.name}\n",
+                f"  {fastest.ops_per_sec:,.0f} ops/s\n",
+                f"\n{YELLOW}最慢操作:{RESET}\n",
+                f"  {slowest.name}\n",
+                f"  {slowest.ops_per_sec:,.0f} ops/s\n",
+            ]
+        
+        sys.stdout.write("".join(parts))
 
 
 def main():
@@ -300,20 +311,26 @@ def main():
     
     benchmarker = Benchmarker()
     
-    print(f"\n{BOLD}Python 2025 知识库 - 性能基准测试{RESET}")
-    print(f"迭代次数: {args.iterations:,}\n")
-    
-    benchmarker.run_basic_benchmarks()
-    benchmarker.run_data_structure_benchmarks()
-    benchmarker.run_comprehension_benchmarks()
+    # --json 时 stdout 只留 JSON，进度与彩色提示改写到 stderr
+    human = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+
+    with human:
+        print(f"\n{BOLD}Python 2025 知识库 - 性能基准测试{RESET}")
+        print(f"迭代次数: {args.iterations:,}\n")
+
+        benchmarker.run_basic_benchmarks()
+        benchmarker.run_data_structure_benchmarks()
+        benchmarker.run_comprehension_benchmarks()
     
     if args.json:
+        # 供程序消费：不缩进、紧凑分隔符，可走_json的C编码器
         report = benchmarker.generate_report()
-        print(json.dumps(report, indent=2, ensure_ascii=False))
+        print(json.dumps(report, ensure_ascii=False, separators=(",", ":")))
     else:
         benchmarker.print_summary()
     
-    print(f"\n{GREEN}✓{RESET} 基准测试完成！\n")
+    with human:
+        print(f"\n{GREEN}✓{RESET} 基准测试完成！\n")
 
 
 if __name__ == "__main__":
@@ -10,10 +10,12 @@ Usage:
 
 import os
 import sys
+import contextlib
 import subprocess
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import shutil
 
 # 颜色代码
@@ -34,6 +36,7 @@ class HealthChecker:
         self.issues: List[Dict] = []
         self.passed: List[str] = []
         self.warnings: List[str] = []
+        self._command_cache: Dict[str, bool] = {}
 
     def print_header(self, text: str) -> None:
         """打印标题"""
@@ -74,8 +77,17 @@ class HealthChecker:
             return False
 
     def check_command_exists(self, command: str) -> bool:
-        """检查命令是否存在"""
-        return shutil.which(command) is not None
+        """检查命令是否存在（结果按命令名缓存，避免重复扫描PATH）"""
+        exists = self._command_cache.get(command)
+        if exists is None:
+            exists = shutil.which(command) is not None
+            self._command_cache[command] = exists
+        return exists
+
+    def _scan_root(self) -> Dict[str, os.DirEntry[str]]:
+        """根目录的 scandir 快照（名称 -> DirEntry），供文件/目录检查共用一次读取"""
+        with os.scandir(self.root_dir) as it:
+            return {entry.name: entry for entry in it}
 
     def check_tools(self) -> None:
         """检查开发工具"""
@@ -96,9 +108,11 @@ class HealthChecker:
                 self.print_warning(f"{tool} 未安装 ({desc})")
                 self.warnings.append(f"Missing tool: {tool}")
 
-    def check_files(self) -> None:
-        """检查必要文件"""
+    def check_files(self, snapshot: Optional[Dict[str, os.DirEntry[str]]] = None) -> None:
+        """检查必要文件（snapshot 为预先读取的根目录快照，缺省时现场扫描）"""
         self.print_info("检查必要文件...")
+        if snapshot is None:
+            snapshot = self._scan_root()
         
         required_files = [
             ("pyproject.toml", "项目配置"),
@@ -112,9 +126,16 @@ class HealthChecker:
             (".pre-commit-config.yaml", "Pre-commit配置"),
         ]
 
+        # 根目录快照代替每个文件一次 exists() 的 stat 调用，语义与 exists() 一致：
+        # 任意类型的目录项都算存在，只有符号链接需要再确认目标未失效；
+        # 快照里按名字精确匹配不到时回退到 exists()，保持大小写不敏感文件系统上的判断
         for file_path, desc in required_files:
-            full_path = self.root_dir / file_path
-            if full_path.exists():
+            entry = snapshot.get(file_path)
+            if entry is not None:
+                found = not entry.is_symlink() or Path(entry.path).exists()
+            else:
+                found = (self.root_dir / file_path).exists()
+            if found:
                 self.print_success(f"{file_path} ({desc})")
                 self.passed.append(f"File: {file_path}")
             else:
@@ -125,9 +146,11 @@ class HealthChecker:
                     "description": desc
                 })
 
-    def check_directories(self) -> None:
-        """检查目录结构"""
+    def check_directories(self, snapshot: Optional[Dict[str, os.DirEntry[str]]] = None) -> None:
+        """检查目录结构（snapshot 为预先读取的根目录快照，缺省时现场扫描）"""
         self.print_info("检查目录结构...")
+        if snapshot is None:
+            snapshot = self._scan_root()
         
         required_dirs = [
             ("python", "核心章节"),
@@ -135,9 +158,17 @@ class HealthChecker:
             (".github/workflows", "CI/CD配置"),
         ]
 
+        # DirEntry 自带目录项类型，is_dir() 一般无需再 stat；
+        # 原先 exists() + is_dir() 每个目录两次 stat；
+        # 快照里按名字精确匹配不到时回退到 is_dir()，保持大小写不敏感文件系统上的判断
         for dir_path, desc in required_dirs:
-            full_path = self.root_dir / dir_path
-            if full_path.exists() and full_path.is_dir():
+            head, _, rest = dir_path.partition("/")
+            entry = snapshot.get(head)
+            if entry is not None:
+                found = entry.is_dir() and (not rest or (Path(entry.path) / rest).is_dir())
+            else:
+                found = (self.root_dir / dir_path).is_dir()
+            if found:
                 self.print_success(f"{dir_path}/ ({desc})")
                 self.passed.append(f"Directory: {dir_path}")
             else:
@@ -152,11 +183,6 @@ class HealthChecker:
         """检查 pyproject.toml 配置"""
         self.print_info("检查 pyproject.toml 配置...")
         
-        pyproject_path = self.root_dir / "pyproject.toml"
-        if not pyproject_path.exists():
-            self.print_error("pyproject.toml 不存在")
-            return
-
         try:
             import tomli
         except ImportError:
@@ -166,41 +192,77 @@ class HealthChecker:
                 self.print_warning("无法导入 tomli/tomllib，跳过配置检查")
                 return
 
-        with open(pyproject_path, "rb") as f:
-            try:
+        pyproject_path = self.root_dir / "pyproject.toml"
+        # 直接打开，以异常判断文件缺失，省去单独的 exists() stat
+        try:
+            with pyproject_path.open("rb") as f:
                 config = tomli.load(f)
-                
-                # 检查必要的配置项
-                if "project" in config:
-                    self.print_success("找到 [project] 配置")
-                    self.passed.append("pyproject.toml: [project]")
-                else:
-                    self.print_error("缺少 [project] 配置")
-                    self.issues.append({
-                        "type": "config",
-                        "section": "project",
-                        "description": "Missing [project] section"
-                    })
-
-                if "tool" in config:
-                    tools = config["tool"]
-                    for tool_name in ["ruff", "mypy", "pytest"]:
-                        if tool_name in tools:
-                            self.print_success(f"找到 [tool.{tool_name}] 配置")
-                            self.passed.append(f"pyproject.toml: [tool.{tool_name}]")
-                        else:
-                            self.print_warning(f"缺少 [tool.{tool_name}] 配置")
-                            self.warnings.append(f"Missing [tool.{tool_name}]")
-
-            except Exception as e:
-                self.print_error(f"解析 pyproject.toml 失败: {e}")
-                self.issues.append({
-                    "type": "config_parse_error",
-                    "error": str(e)
-                })
+        except FileNotFoundError:
+            self.print_error("pyproject.toml 不存在")
+            return
+        except Exception as e:
+            self.print_error(f"解析 pyproject.toml 失败: {e}")
+            self.issues.append({
+                "type": "config_parse_error",
+                "error": str(e)
+            })
+            return
 
-    def check_git_status(self) -> None:
-        """检查 Git 状态"""
+        # 检查必要的配置项
+        if "project" in config:
+            self.print_success("找到 [project] 配置")
+            self.passed.append("pyproject.toml: [project]")
+        else:
+            self.print_error("缺少 [project] 配置")
+            self.issues.append({
+                "type": "config",
+                "section": "project",
+                "description": "Missing [project] section"
+            })
+
+        if "tool" in config:
+            tools = config["tool"]
+            for tool_name in ["ruff", "mypy", "pytest"]:
+                if tool_name in tools:
+                    self.print_success(f"找到 [tool.{tool_name}] 配置")
+                    self.passed.append(f"pyproject.toml: [tool.{tool_name}]")
+                else:
+                    self.print_warning(f"缺少 [tool.{tool_name}] 配置")
+                    self.warnings.append(f"Missing [tool.{tool_name}]")
+
+    def _probe_git(self) -> Tuple[bool, bool]:
+        """探测 Git 状态，返回 (是否为仓库, 是否有未提交的更改)"""
+        # 一次 git status 同时回答两个问题：非仓库时返回码非零，
+        # 省去单独的 rev-parse 进程
+        result = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=self.root_dir,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode != 0:
+            return False, False
+        return True, bool(result.stdout.strip())
+
+    def _probe_docker(self) -> Tuple[bool, int]:
+        """探测 Docker 状态，返回 (是否运行, 运行中的容器数)"""
+        # 逐行读取计数，不把整个输出缓冲成一个字符串
+        with subprocess.Popen(
+            ["docker", "ps"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ) as proc:
+            assert proc.stdout is not None
+            line_count = sum(1 for _ in proc.stdout)
+        if proc.returncode != 0:
+            return False, 0
+
+        return True, max(line_count - 1, 0)  # 减去标题行
+
+    def check_git_status(self, probe: Optional[Future[Tuple[bool, bool]]] = None) -> None:
+        """检查 Git 状态（probe 为预先提交的 _probe_git 任务）"""
         self.print_info("检查 Git 状态...")
         
         if not self.check_command_exists("git"):
@@ -208,29 +270,13 @@ class HealthChecker:
             return
 
         try:
-            # 检查是否是 Git 仓库
-            result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=self.root_dir,
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            is_repo, dirty = probe.result() if probe else self._probe_git()
             
-            if result.returncode == 0:
+            if is_repo:
                 self.print_success("Git 仓库已初始化")
                 self.passed.append("Git repository")
                 
-                # 检查是否有未提交的更改
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    cwd=self.root_dir,
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                
-                if result.stdout.strip():
+                if dirty:
                     self.print_warning("有未提交的更改")
                     self.warnings.append("Uncommitted changes")
                 else:
@@ -242,8 +288,8 @@ class HealthChecker:
         except Exception as e:
             self.print_error(f"检查 Git 状态失败: {e}")
 
-    def check_docker_services(self) -> None:
-        """检查 Docker 服务状态"""
+    def check_docker_services(self, probe: Optional[Future[Tuple[bool, int]]] = None) -> None:
+        """检查 Docker 服务状态（probe 为预先提交的 _probe_docker 任务）"""
         self.print_info("检查 Docker 服务...")
         
         if not self.check_command_exists("docker"):
@@ -251,21 +297,13 @@ class HealthChecker:
             return
 
         try:
-            # 检查 Docker 是否运行
-            result = subprocess.run(
-                ["docker", "ps"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            running, container_count = probe.result() if probe else self._probe_docker()
             
-            if result.returncode == 0:
+            if running:
                 self.print_success("Docker 服务运行中")
                 self.passed.append("Docker running")
                 
                 # 统计运行中的容器
-                lines = result.stdout.strip().split("\n")
-                container_count = len(lines) - 1  # 减去标题行
                 if container_count > 0:
                     self.print_info(f"运行中的容器: {container_count}")
                     self.passed.append(f"{container_count} containers running")
@@ -283,42 +321,57 @@ class HealthChecker:
         
         total = len(self.passed) + len(self.warnings) + len(self.issues)
         
-        print(f"{BOLD}总检查项:{RESET} {total}")
-        print(f"{GREEN}✓ 通过:{RESET} {len(self.passed)}")
-        print(f"{YELLOW}⚠ 警告:{RESET} {len(self.warnings)}")
-        print(f"{RED}✗ 错误:{RESET} {len(self.issues)}")
+        # 报告正文先收集成行，最后一次性输出
+        lines = [
+            f"{BOLD}总检查项:{RESET} {total}",
+            f"{GREEN}✓ 通过:{RESET} {len(self.passed)}",
+            f"{YELLOW}⚠ 警告:{RESET} {len(self.warnings)}",
+            f"{RED}✗ 错误:{RESET} {len(self.issues)}",
+        ]
         
         if self.issues:
-            print(f"\n{RED}{BOLD}发现的问题:{RESET}")
-            for i, issue in enumerate(self.issues, 1):
-                print(f"{i}. {issue.get('type')}: {issue}")
+            lines.append(f"\n{RED}{BOLD}发现的问题:{RESET}")
+            lines.extend(
+                f"{i}. {issue.get('type')}: {issue}"
+                for i, issue in enumerate(self.issues, 1)
+            )
         
         if self.warnings:
-            print(f"\n{YELLOW}{BOLD}警告:{RESET}")
-            for warning in self.warnings:
-                print(f"  - {warning}")
+            lines.append(f"\n{YELLOW}{BOLD}警告:{RESET}")
+            lines.extend(f"  - {warning}" for warning in self.warnings)
 
-        print(f"\n{BOLD}健康评分:{RESET} ", end="")
         if len(self.issues) == 0 and len(self.warnings) == 0:
-            print(f"{GREEN}100% - 完美!{RESET} 🎉")
+            score_text = f"{GREEN}100% - 完美!{RESET} 🎉"
         elif len(self.issues) == 0:
             score = int((len(self.passed) / total) * 100)
-            print(f"{YELLOW}{score}% - 良好{RESET} ✅")
+            score_text = f"{YELLOW}{score}% - 良好{RESET} ✅"
         else:
             score = int((len(self.passed) / total) * 100)
-            print(f"{RED}{score}% - 需要改进{RESET} ⚠️")
+            score_text = f"{RED}{score}% - 需要改进{RESET} ⚠️"
+        lines.append(f"\n{BOLD}健康评分:{RESET} {score_text}")
+
+        print("\n".join(lines))
 
     def run_all_checks(self) -> bool:
         """运行所有检查"""
         self.print_header("Python 2025 知识库 - 健康检查")
         
-        self.check_python_version()
-        self.check_tools()
-        self.check_files()
-        self.check_directories()
-        self.check_pyproject_toml()
-        self.check_git_status()
-        self.check_docker_services()
+        # git/docker 探测耗时在子进程且互不依赖，先在后台并行启动；
+        # 其余检查照常执行，输出顺序不变
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            git_probe = (pool.submit(self._probe_git)
+                         if self.check_command_exists("git") else None)
+            docker_probe = (pool.submit(self._probe_docker)
+                            if self.check_command_exists("docker") else None)
+
+            self.check_python_version()
+            self.check_tools()
+            root_entries = self._scan_root()
+            self.check_files(root_entries)
+            self.check_directories(root_entries)
+            self.check_pyproject_toml()
+            self.check_git_status(git_probe)
+            self.check_docker_services(docker_probe)
         
         self.generate_report()
         
@@ -346,7 +399,10 @@ def main():
     args = parser.parse_args()
     
     checker = HealthChecker(auto_fix=args.fix)
-    success = checker.run_all_checks()
+    # --json 时 stdout 只留 JSON，检查过程与报告改写到 stderr
+    human = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    with human:
+        success = checker.run_all_checks()
     
     if args.json:
         result = {
@@ -355,7 +411,8 @@ def main():
             "issues": checker.issues,
             "success": success
         }
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        # 供程序消费：不缩进、紧凑分隔符
+        print(json.dumps(result, ensure_ascii=False, separators=(",", ":")))
     
     sys.exit(0 if success else 1)
 
@@ -13,7 +13,6 @@ import os
 import sys
 import shutil
 from pathlib import Path
-from typing import Dict, List
 import subprocess
 
 # 颜色代码
@@ -25,6 +24,19 @@ RESET = "\033[0m"
 BOLD = "\033[1m"
 
 
+def _write_file(path: Path, content: str) -> None:
+    """一次性写入生成的文件（内容已知，绕过文本IO层直接写fd）"""
+    data = content.encode("utf-8")
+    # 与 write_text 一致用 0o666，实际权限由 umask 决定
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class ProjectInitializer:
     """项目初始化器"""
 
@@ -177,7 +189,7 @@ exclude_lines = [
 '''
         
         file_path = self.project_dir / "pyproject.toml"
-        file_path.write_text(content)
+        _write_file(file_path, content)
         self.print_success(f"创建: pyproject.toml")
 
     def create_readme(self) -> None:
@@ -254,7 +266,7 @@ MIT License
 '''
         
         file_path = self.project_dir / "README.md"
-        file_path.write_text(content)
+        _write_file(file_path, content)
         self.print_success("创建: README.md")
 
     def create_gitignore(self) -> None:
@@ -314,7 +326,7 @@ venv.bak/
 '''
         
         file_path = self.project_dir / ".gitignore"
-        file_path.write_text(content)
+        _write_file(file_path, content)
         self.print_success("创建: .gitignore")
 
     def create_license(self) -> None:
@@ -348,7 +360,7 @@ SOFTWARE.
 '''
         
         file_path = self.project_dir / "LICENSE"
-        file_path.write_text(content)
+        _write_file(file_path, content)
         self.print_success("创建: LICENSE")
 
     def create_source_files(self) -> None:
@@ -366,7 +378,7 @@ SOFTWARE.
 __version__ = "0.1.0"
 '''.format(self.project_name)
         
-        (src_dir / "__init__.py").write_text(init_content)
+        _write_file(src_dir / "__init__.py", init_content)
         self.print_success(f"创建: src/{package_name}/__init__.py")
         
         # main.py
@@ -382,7 +394,7 @@ if __name__ == "__main__":
     main()
 '''
         
-        (src_dir / "main.py").write_text(main_content)
+        _write_file(src_dir / "main.py", main_content)
         self.print_success(f"创建: src/{package_name}/main.py")
 
     def create_test_files(self) -> None:
@@ -407,7 +419,7 @@ def test_example() -> None:
 '''
         
         test_file = self.project_dir / "tests" / "test_example.py"
-        test_file.write_text(test_content)
+        _write_file(test_file, test_content)
         self.print_success("创建: tests/test_example.py")
         
         # __init__.py